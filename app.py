@@ -1,9 +1,20 @@
 import os
 import shutil
+import stat
+import sys
+import threading
 import webbrowser
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from typing import Dict, List, Tuple
 
-from flask import Flask, jsonify, request, render_template
+import orjson
+from flask import Flask, Response, abort, jsonify, request, render_template, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import liburing
+except ImportError:  # optional, Linux-only; exports fall back to the thread pool
+    liburing = None
 
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -11,35 +22,75 @@ RAW_DIR = os.path.join(BASE_DIR, "raw")
 FIXED_DIR = os.path.join(BASE_DIR, "fixed_metadata")
 CONVENTION_FILE = os.path.join(BASE_DIR, "naming_convention.txt")
 
+# Precomputed so per-file hot paths can use plain concatenation and
+# slicing instead of os.path.join/os.path.relpath for every file.
+RAW_PREFIX = RAW_DIR + os.sep
+FIXED_PREFIX = FIXED_DIR + os.sep
+BASE_LEN = len(BASE_DIR) + 1
+
+
+# Canonical section names keyed by the first word of the header line,
+# so normalization is a single dict lookup instead of a startswith ladder.
+_SECTION_PREFIX_MAP = {
+    "UNIVERSAL": "Universal",
+    "PLAYA": "PLAY'A VR",
+    "SKYBOX": "Skybox VR Player",
+    "PIGASUS": "Pigasus VR",
+    "RAD": "Rad TV",
+    "COMMEDIA": "Commedia",
+    "OCULUS": "Oculus Video App",
+}
+
 
 def _normalize_section_name(header_line: str) -> str:
     text = header_line.strip().rstrip(":")
-    text_upper = text.upper()
-    if text_upper.startswith("UNIVERSAL PATTERNS"):
-        return "Universal"
-    if text_upper.startswith("PLAYA VR") or text_upper.startswith("PLAYA VR SPECIFIC"):
-        return "PLAY'A VR"
-    if text_upper.startswith("SKYBOX VR"):
-        return "Skybox VR Player"
-    if text_upper.startswith("PIGASUS"):
-        return "Pigasus VR"
-    if text_upper.startswith("RAD TV"):
-        return "Rad TV"
-    if text_upper.startswith("COMMEDIA"):
-        return "Commedia"
-    if text_upper.startswith("OCULUS"):
-        return "Oculus Video App"
-    return text
-
-
-def parse_naming_conventions(file_path: str) -> Dict[str, List[str]]:
-    if not os.path.exists(file_path):
+    first_word = text.upper().partition(" ")[0]
+    return _SECTION_PREFIX_MAP.get(first_word, text)
+
+
+# Parsed conventions cached per file, invalidated when the file's
+# (mtime_ns, size) changes. The file is effectively static during a run,
+# so repeated API calls cost one stat() plus a dict lookup.
+_CONV_LOCK = threading.Lock()
+_CONV_CACHE: Dict[str, Tuple[int, int, Dict[str, Tuple[str, ...]], List[str]]] = {}
+
+
+def parse_naming_conventions(file_path: str) -> Dict[str, Tuple[str, ...]]:
+    try:
+        st = os.stat(file_path)
+    except OSError:
         return {}
 
+    with _CONV_LOCK:
+        cached = _CONV_CACHE.get(file_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+
+    conventions = _parse_naming_conventions_uncached(file_path)
+    players = sorted(conventions.keys())
+    with _CONV_LOCK:
+        _CONV_CACHE[file_path] = (st.st_mtime_ns, st.st_size, conventions, players)
+    return conventions
+
+
+def list_player_names(file_path: str) -> List[str]:
+    """Sorted player names from the convention file, via the same cache."""
+    conventions = parse_naming_conventions(file_path)
+    with _CONV_LOCK:
+        cached = _CONV_CACHE.get(file_path)
+        if cached is not None and cached[2] is conventions:
+            return cached[3]
+    return sorted(conventions.keys())
+
+
+def _parse_naming_conventions_uncached(file_path: str) -> Dict[str, Tuple[str, ...]]:
     with open(file_path, "r", encoding="utf-8") as f:
         lines = [line.rstrip("\n") for line in f]
 
-    conventions: Dict[str, List[str]] = {}
+    # Sets deduplicate tokens in O(1) instead of scanning a growing list;
+    # insertion order of the sections themselves is preserved by the dict.
+    sections: Dict[str, set] = {}
+    current_tokens: set = set()
     current_section: str = ""
 
     for line in lines:
@@ -49,8 +100,7 @@ def parse_naming_conventions(file_path: str) -> Dict[str, List[str]]:
         # Section header ends with ':' in the source file
         if line.strip().endswith(":"):
             current_section = _normalize_section_name(line)
-            if current_section not in conventions:
-                conventions[current_section] = []
+            current_tokens = sections.setdefault(current_section, set())
             continue
 
         if current_section == "":
@@ -64,74 +114,364 @@ def parse_naming_conventions(file_path: str) -> Dict[str, List[str]]:
             tokens = [line.strip()]
 
         for token in tokens:
-            if not token:
-                continue
             # keep only patterns that look like filename hints (start with underscore)
-            if token.startswith("_") and token not in conventions[current_section]:
-                conventions[current_section].append(token)
+            if token.startswith("_"):
+                # the vocabulary is tiny and fixed, so intern the tokens and
+                # share one string object per pattern across reparses
+                current_tokens.add(sys.intern(token))
 
-    # Ensure deterministic ordering
-    for key in conventions.keys():
-        conventions[key] = sorted(conventions[key], key=lambda s: s.lower())
-
-    return conventions
+    # Ensure deterministic ordering; tuples keep the cached sections
+    # read-only and they serialize identically to lists
+    return {key: tuple(sorted(values, key=str.lower)) for key, values in sections.items()}
 
 
 def list_raw_mp4s() -> List[str]:
-    if not os.path.isdir(RAW_DIR):
+    try:
+        with os.scandir(RAW_DIR) as it:
+            return sorted(e.name for e in it if e.name.endswith((".mp4", ".MP4")))
+    except OSError:
         return []
-    return sorted([f for f in os.listdir(RAW_DIR) if f.lower().endswith(".mp4")])
+
+
+# Directory listings cached against the directory's own mtime — adding or
+# removing an entry bumps it, so a matching mtime means the cached names
+# are exact and repeated UI polls cost one stat() each.
+_DIR_LOCK = threading.Lock()
+_DIR_CACHE: Dict[str, Tuple[int, Dict[str, List[str]]]] = {}
+_TREE_CACHE: Dict[str, Tuple[Tuple[Tuple[str, int], ...], List[str]]] = {}
 
 
 def get_directory_contents(directory_path: str) -> Dict[str, List[str]]:
     """Get contents of a directory, separating folders and MP4 files."""
-    if not os.path.isdir(directory_path):
+    try:
+        mtime = os.stat(directory_path).st_mtime_ns
+    except OSError:
         return {"folders": [], "files": []}
-    
+
+    with _DIR_LOCK:
+        cached = _DIR_CACHE.get(directory_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+    folders = []
+    files = []
+
     try:
-        items = os.listdir(directory_path)
-        folders = []
-        files = []
-        
-        for item in items:
-            item_path = os.path.join(directory_path, item)
-            if os.path.isdir(item_path):
-                folders.append(item)
-            elif item.lower().endswith(".mp4"):
-                files.append(item)
-        
-        return {
-            "folders": sorted(folders),
-            "files": sorted(files)
-        }
-    except PermissionError:
+        # scandir reuses the dirent type from the kernel, avoiding a
+        # separate stat() per entry the way listdir + isdir would.
+        with os.scandir(directory_path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(entry.name)
+                elif entry.name.endswith((".mp4", ".MP4")):
+                    files.append(entry.name)
+    except OSError:
         return {"folders": [], "files": []}
 
+    result = {
+        "folders": sorted(folders),
+        "files": sorted(files)
+    }
+    with _DIR_LOCK:
+        _DIR_CACHE[directory_path] = (mtime, result)
+    return result
+
 
 def find_all_mp4_files(directory_path: str) -> List[str]:
-    """Recursively find all MP4 files in a directory and its subdirectories."""
+    """Recursively find all MP4 files in a directory and its subdirectories.
+
+    Iterative scandir walk: entry types come from the dirent record, so no
+    per-entry stat(), and relative paths are sliced off entry.path instead
+    of going through os.path.relpath for every file.
+    """
+    directory_path = os.fspath(directory_path)
+
+    # A cached walk is still valid if every directory it visited has kept
+    # its mtime, which costs one stat() per directory instead of a full
+    # re-enumeration.
+    with _DIR_LOCK:
+        cached = _TREE_CACHE.get(directory_path)
+    if cached is not None and _dir_mtimes_unchanged(cached[0]):
+        return cached[1]
+
+    base_len = len(directory_path) + 1
+
+    def scan_one(current):
+        try:
+            mtime = os.stat(current).st_mtime_ns
+            it = os.scandir(current)
+        except OSError:
+            return None
+        subdirs = []
+        names = []
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith((".mp4", ".MP4")):
+                    names.append(entry.path[base_len:])
+        return current, mtime, subdirs, names
+
+    # Sibling directories are enumerated concurrently; each scandir is a
+    # separate round trip on SMB/NFS mounts, so overlapping them matters
+    # far more there than on local disks.
     mp4_files = []
-    if not os.path.isdir(directory_path):
-        return mp4_files
-    
+    dir_mtimes = []
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        outstanding = {ex.submit(scan_one, directory_path)}
+        while outstanding:
+            done, outstanding = wait(outstanding, return_when=FIRST_COMPLETED)
+            for fut in done:
+                scanned = fut.result()
+                if scanned is None:
+                    continue
+                current, mtime, subdirs, names = scanned
+                dir_mtimes.append((current, mtime))
+                mp4_files.extend(names)
+                for subdir in subdirs:
+                    outstanding.add(ex.submit(scan_one, subdir))
+    mp4_files.sort()
+    with _DIR_LOCK:
+        _TREE_CACHE[directory_path] = (tuple(dir_mtimes), mp4_files)
+    return mp4_files
+
+
+def _dir_mtimes_unchanged(dir_mtimes: Tuple[Tuple[str, int], ...]) -> bool:
     try:
-        for root, dirs, files in os.walk(directory_path):
-            for file in files:
-                if file.lower().endswith(".mp4"):
-                    # Get relative path from the raw directory
-                    rel_path = os.path.relpath(os.path.join(root, file), directory_path)
-                    mp4_files.append(rel_path)
-    except PermissionError:
-        pass
-    
-    return sorted(mp4_files)
+        for path, mtime in dir_mtimes:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+    except OSError:
+        return False
+    return True
+
+
+def _fast_copy(src: str, dst: str) -> None:
+    """Copy src to dst with metadata, using kernel zero-copy where available.
+
+    On Linux os.sendfile moves the bytes entirely in kernel space, so MP4
+    data never crosses into Python buffers. Falls back to shutil's own
+    fast-copy paths (fcopyfile on macOS, buffered copy elsewhere, and for
+    filesystems where sendfile is refused, e.g. some network mounts).
+    """
+    if hasattr(os, "sendfile"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            in_fd = fsrc.fileno()
+            out_fd = fdst.fileno()
+            size = os.fstat(in_fd).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                if offset == 0:
+                    # sendfile unsupported for this pair; plain chunked copy
+                    shutil.copyfileobj(fsrc, fdst)
+                else:
+                    raise
+    else:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+# Manifest of completed exports, so re-running an export only copies files
+# whose source stat or pattern actually changed. Maps the destination path
+# relative to fixed_metadata/ to [src_rel, src_mtime_ns, src_size, pattern].
+_MANIFEST_FILE = os.path.join(FIXED_DIR, ".vrmeta_manifest.json")
+_MANIFEST_LOCK = threading.Lock()
+_MANIFEST = None  # lazily loaded Dict[str, List]
+
+
+def _load_manifest() -> Dict[str, List]:
+    global _MANIFEST
+    with _MANIFEST_LOCK:
+        if _MANIFEST is None:
+            try:
+                with open(_MANIFEST_FILE, "rb") as fh:
+                    _MANIFEST = orjson.loads(fh.read())
+            except (OSError, orjson.JSONDecodeError):
+                _MANIFEST = {}
+        return _MANIFEST
+
+
+def _save_manifest(updates: Dict[str, List]) -> None:
+    with _MANIFEST_LOCK:
+        _MANIFEST.update(updates)
+        data = orjson.dumps(_MANIFEST)
+    # Atomic rewrite, same as the test tracker: temp file plus os.replace
+    tmp_file = _MANIFEST_FILE + ".tmp"
+    with open(tmp_file, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp_file, _MANIFEST_FILE)
+
+
+# io_uring batching only pays off when there are enough files to keep the
+# submission queue busy; small exports go straight to the thread pool.
+_URING_MIN_FILES = 4
+_URING_QUEUE_DEPTH = 32
+_URING_MAX_INFLIGHT = 16
+_URING_BUF_SIZE = 1 << 20
+
+
+class _UringCopyEngine:
+    """Copy many files through a single io_uring.
+
+    Each in-flight file alternates one read and one write SQE, so the
+    kernel overlaps I/O across up to _URING_MAX_INFLIGHT files per batch
+    instead of serializing a syscall pair per chunk per file.
+    """
+
+    def __init__(self) -> None:
+        self._ring = liburing.Ring()
+        liburing.io_uring_queue_init(_URING_QUEUE_DEPTH, self._ring)
+        self._cqe = liburing.Cqe()
+
+    def close(self) -> None:
+        liburing.io_uring_queue_exit(self._ring)
+
+    def _submit_read(self, token: int, slot: Dict) -> None:
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_read(sqe, slot["in_fd"], slot["buf"], slot["offset"])
+        liburing.io_uring_sqe_set_data64(sqe, token)
+        slot["phase"] = "read"
+        liburing.io_uring_submit(self._ring)
+
+    def _submit_write(self, token: int, slot: Dict, start: int) -> None:
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        chunk = bytes(memoryview(slot["buf"])[start:slot["chunk_len"]])
+        slot["chunk"] = chunk  # keep the buffer alive until the write completes
+        liburing.io_uring_prep_write(sqe, slot["out_fd"], chunk, slot["offset"] + start)
+        liburing.io_uring_sqe_set_data64(sqe, token)
+        slot["phase"] = "write"
+        slot["written"] = start
+        liburing.io_uring_submit(self._ring)
+
+    @staticmethod
+    def _close_slot(slot: Dict) -> None:
+        os.close(slot["in_fd"])
+        os.close(slot["out_fd"])
+
+    def copy_all(self, pairs):
+        """Yield (file, dst, error-or-None) as each copy finishes."""
+        pending = iter(pairs)
+        slots: Dict[int, Dict] = {}
+        next_token = 0
+        exhausted = False
+        while True:
+            while not exhausted and len(slots) < _URING_MAX_INFLIGHT:
+                try:
+                    f, src, dst = next(pending)
+                except StopIteration:
+                    exhausted = True
+                    break
+                try:
+                    in_fd = os.open(src, os.O_RDONLY)
+                except OSError as exc:
+                    yield (f, dst, exc)
+                    continue
+                try:
+                    out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                except OSError as exc:
+                    os.close(in_fd)
+                    yield (f, dst, exc)
+                    continue
+                size = os.fstat(in_fd).st_size
+                slot = {"f": f, "src": src, "dst": dst, "in_fd": in_fd,
+                        "out_fd": out_fd, "size": size, "offset": 0,
+                        "buf": bytearray(min(_URING_BUF_SIZE, size))}
+                if size == 0:
+                    self._close_slot(slot)
+                    shutil.copystat(src, dst)
+                    yield (f, dst, None)
+                    continue
+                slots[next_token] = slot
+                self._submit_read(next_token, slot)
+                next_token += 1
+            if not slots:
+                break
+
+            liburing.io_uring_wait_cqe(self._ring, self._cqe)
+            entry = self._cqe[0]
+            res, token = entry.res, entry.user_data
+            liburing.io_uring_cqe_seen(self._ring, entry)
+            slot = slots[token]
+
+            if res < 0:
+                del slots[token]
+                self._close_slot(slot)
+                yield (slot["f"], slot["dst"], OSError(-res, os.strerror(-res)))
+                continue
+
+            done = False
+            if slot["phase"] == "read":
+                if res == 0:
+                    done = True  # unexpected EOF; treat what we have as complete
+                else:
+                    slot["chunk_len"] = res
+                    self._submit_write(token, slot, 0)
+                    continue
+            else:
+                written = slot["written"] + res
+                if written < slot["chunk_len"]:
+                    self._submit_write(token, slot, written)
+                    continue
+                slot["offset"] += slot["chunk_len"]
+                done = slot["offset"] >= slot["size"]
+                if not done:
+                    self._submit_read(token, slot)
+                    continue
+
+            del slots[token]
+            self._close_slot(slot)
+            shutil.copystat(slot["src"], slot["dst"])
+            yield (slot["f"], slot["dst"], None)
+
+
+def _iter_copy_results(pairs):
+    """Copy (file, src, dst) pairs, yielding (file, dst, error-or-None) as
+    each finishes. Large batches go through io_uring when available;
+    otherwise copies run on the sendfile-backed thread pool."""
+    if liburing is not None and len(pairs) >= _URING_MIN_FILES:
+        try:
+            engine = _UringCopyEngine()
+        except (OSError, MemoryError):
+            engine = None
+        if engine is not None:
+            try:
+                yield from engine.copy_all(pairs)
+            finally:
+                engine.close()
+            return
+
+    max_workers = min(32, (os.cpu_count() or 4) * 4, len(pairs))
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = {ex.submit(_fast_copy, src, dst): (f, dst) for f, src, dst in pairs}
+        for fut in as_completed(futures):
+            f, dst = futures[fut]
+            try:
+                fut.result()
+            except OSError as exc:
+                yield (f, dst, exc)
+            else:
+                yield (f, dst, None)
 
 
 def build_new_name(original_name: str, pattern: str) -> str:
-    name, ext = os.path.splitext(original_name)
-    if pattern in name:
-        return f"{name}{ext}"
-    return f"{name}{pattern}{ext}"
+    if not pattern:
+        return original_name
+    dot = original_name.rfind(".")
+    if dot < 0:
+        stem, ext = original_name, ""
+    else:
+        stem, ext = original_name[:dot], original_name[dot:]
+    # Suffix check: only skip appending when the pattern is already at the
+    # end of the stem, where VR players expect it
+    if stem.endswith(pattern):
+        return original_name
+    return f"{stem}{pattern}{ext}"
 
 
 def ensure_dirs() -> None:
@@ -139,7 +479,19 @@ def ensure_dirs() -> None:
     os.makedirs(FIXED_DIR, exist_ok=True)
 
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which encodes/decodes several times
+    faster than the stdlib codec Flask uses by default."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
 
 @app.route("/")
@@ -149,8 +501,7 @@ def index():
 
 @app.route("/api/players", methods=["GET"])
 def api_players():
-    conventions = parse_naming_conventions(CONVENTION_FILE)
-    players = sorted(conventions.keys())
+    players = list_player_names(CONVENTION_FILE)
     return jsonify({"players": players})
 
 
@@ -158,39 +509,96 @@ def api_players():
 def api_conventions():
     player = request.args.get("player", "").strip()
     conventions = parse_naming_conventions(CONVENTION_FILE)
-    patterns = conventions.get(player, [])
+    patterns = conventions.get(player, ())
     return jsonify({"player": player, "patterns": patterns})
 
 
-@app.route("/api/files", methods=["GET"]) 
-def api_files():
+def _files_payload(subdir: str, include_all: bool = False) -> Dict:
     ensure_dirs()
-    subdir = request.args.get("subdir", "").strip()
-    
+
     # Build the full path to the directory we want to browse
     if subdir:
-        # Sanitize the subdirectory path to prevent directory traversal attacks
-        subdir = os.path.normpath(subdir)
-        if subdir.startswith("..") or subdir.startswith("/"):
+        # Resolve the path once and reject anything that escapes raw/,
+        # instead of normpath + prefix guessing
+        raw_real = os.path.realpath(RAW_DIR)
+        abs_target = os.path.realpath(os.path.join(RAW_DIR, subdir))
+        if os.path.commonpath([abs_target, raw_real]) != raw_real:
+            abort(400, description="Invalid subdirectory")
+        target_dir = abs_target
+        subdir = os.path.relpath(abs_target, raw_real)
+        if subdir == ".":
             subdir = ""
-        target_dir = os.path.join(RAW_DIR, subdir)
     else:
         target_dir = RAW_DIR
         subdir = ""
-    
+
     # Get directory contents
     contents = get_directory_contents(target_dir)
-    
-    # Also get all MP4 files recursively for the "show all" option
-    all_mp4_files = find_all_mp4_files(RAW_DIR)
-    
-    return jsonify({
+
+    # The recursive listing for the "show all" option is only computed
+    # when the client actually asks for it
+    all_mp4_files = find_all_mp4_files(RAW_DIR) if include_all else []
+
+    return {
         "raw_dir": os.path.relpath(RAW_DIR, BASE_DIR),
         "current_dir": subdir,
         "folders": contents["folders"],
         "files": contents["files"],
         "all_mp4_files": all_mp4_files
-    })
+    }
+
+
+@app.route("/api/files", methods=["GET"])
+def api_files():
+    return jsonify(_files_payload(
+        request.args.get("subdir", "").strip(),
+        include_all=request.args.get("all") == "1",
+    ))
+
+
+def _players_op(conventions: Dict[str, Tuple[str, ...]], args: Dict) -> Dict:
+    return {"players": sorted(conventions.keys())}
+
+
+def _conventions_op(conventions: Dict[str, Tuple[str, ...]], args: Dict) -> Dict:
+    player = str(args.get("player", "")).strip()
+    return {"player": player, "patterns": conventions.get(player, ())}
+
+
+def _files_op(conventions: Dict[str, Tuple[str, ...]], args: Dict) -> Dict:
+    return _files_payload(
+        str(args.get("subdir", "")).strip(),
+        include_all=str(args.get("all", "")) == "1",
+    )
+
+
+_BATCH_OPS = {
+    "players": _players_op,
+    "conventions": _conventions_op,
+    "files": _files_op,
+}
+
+
+@app.route("/api/batch", methods=["POST"])
+def api_batch():
+    """Serve several read ops in one round trip.
+
+    Takes {"requests": [{"id": ..., "op": "players"|"conventions"|"files",
+    "args": {...}}]} and answers each in order, sharing a single parse of
+    the convention file across the whole batch.
+    """
+    payload = request.get_json(force=True) or {}
+    conventions = parse_naming_conventions(CONVENTION_FILE)
+    responses = []
+    for item in payload.get("requests", []):
+        op = item.get("op")
+        handler = _BATCH_OPS.get(op)
+        if handler is None:
+            body = {"error": f"unknown op: {op}"}
+        else:
+            body = handler(conventions, item.get("args") or {})
+        responses.append({"id": item.get("id"), "body": body})
+    return jsonify({"responses": responses})
 
 
 @app.route("/api/preview", methods=["POST"]) 
@@ -221,13 +629,28 @@ def api_export():
     files: List[str] = payload.get("files", [])
     pattern: str = payload.get("pattern", "")
 
-    results = []
+    manifest = _load_manifest()
+    pending_keys = {}
+    claimed_dsts = {}
+    precomputed = []
+    pairs = []
     for f in files:
-        src = os.path.join(RAW_DIR, f)
-        if not os.path.isfile(src):
-            results.append({"file": f, "status": "missing"})
+        # Selections come from the raw/ listings, so a path that climbs out
+        # of raw/ is never legitimate
+        if f.startswith(("/", "\\")) or ".." in f.replace("\\", "/").split("/"):
+            precomputed.append({"file": f, "status": "missing"})
             continue
-        
+
+        src = RAW_PREFIX + f
+        try:
+            src_stat = os.stat(src)
+        except OSError:
+            precomputed.append({"file": f, "status": "missing"})
+            continue
+        if not stat.S_ISREG(src_stat.st_mode):
+            precomputed.append({"file": f, "status": "missing"})
+            continue
+
         # Build new name, preserving directory structure if file is in subdirectory
         if "/" in f or "\\" in f:
             # File is in a subdirectory, preserve the directory structure
@@ -238,16 +661,57 @@ def api_export():
         else:
             # File is in root directory
             new_name = build_new_name(f, pattern)
-        
-        dst = os.path.join(FIXED_DIR, new_name)
-        
-        # Ensure the destination directory exists
-        os.makedirs(os.path.dirname(dst), exist_ok=True)
-        
-        shutil.copy2(src, dst)
-        results.append({"file": f, "copied_to": os.path.relpath(dst, BASE_DIR), "status": "ok"})
 
-    return jsonify({"results": results})
+        dst = FIXED_PREFIX + new_name
+
+        # Skip files already exported with an identical source and pattern.
+        # A skip still claims its destination: letting a later colliding
+        # file overwrite it would invalidate both the skipped result and
+        # the manifest entry it was based on.
+        key = [f, src_stat.st_mtime_ns, src_stat.st_size, pattern]
+        if manifest.get(new_name) == key and os.path.exists(dst) and dst not in claimed_dsts:
+            claimed_dsts[dst] = f
+            precomputed.append({"file": f, "copied_to": dst[BASE_LEN:], "status": "skipped"})
+            continue
+
+        # Two selections can normalize to the same destination (e.g. clip.mp4
+        # next to an already-suffixed clip_180_LR.mp4). Concurrent O_TRUNC
+        # copies to one path interleave and corrupt it, so the first claim
+        # wins and later ones are reported as conflicts instead of copied.
+        claimed = claimed_dsts.get(dst)
+        if claimed is not None:
+            precomputed.append({"file": f, "status": "conflict", "conflicts_with": claimed})
+            continue
+        claimed_dsts[dst] = f
+
+        pending_keys[dst] = (new_name, key)
+        pairs.append((f, src, dst))
+
+    # Create each destination directory exactly once, instead of a
+    # redundant makedirs per file when many share a subfolder
+    for dst_dir in {os.path.dirname(dst) for _, _, dst in pairs}:
+        os.makedirs(dst_dir, exist_ok=True)
+
+    # Stream one NDJSON line per file as its copy finishes, so the browser
+    # can show progress and the server never buffers the whole result set.
+    def generate():
+        for result in precomputed:
+            yield orjson.dumps(result) + b"\n"
+        if not pairs:
+            return
+        updates = {}
+        for f, dst, error in _iter_copy_results(pairs):
+            if error is not None:
+                result = {"file": f, "status": "error", "error": str(error)}
+            else:
+                new_name, key = pending_keys[dst]
+                updates[new_name] = key
+                result = {"file": f, "copied_to": dst[BASE_LEN:], "status": "ok"}
+            yield orjson.dumps(result) + b"\n"
+        if updates:
+            _save_manifest(updates)
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
 
 
 def open_browser(port: int) -> None:
@@ -261,6 +725,10 @@ if __name__ == "__main__":
     ensure_dirs()
     port = int(os.environ.get("PORT", "5001"))
     open_browser(port)
-    app.run(host="127.0.0.1", port=port, debug=False)
+    # waitress serves requests on a worker-thread pool, so a long-running
+    # export no longer blocks the /api/files and preview calls the way the
+    # single-threaded Werkzeug dev server did
+    from waitress import serve
+    serve(app, host="127.0.0.1", port=port, threads=8)
 
 
@@ -4,46 +4,66 @@ Test Manager for VR Metadata Inserter
 Helps track test numbers and descriptions for development testing.
 """
 
-import json
 import os
 from datetime import datetime
+
+import orjson
 from typing import Dict, List, Optional
 
 TEST_TRACKER_FILE = "test_tracker.json"
 
+# Parsed tracker cached by file mtime, so back-to-back calls (add, list,
+# next) don't re-decode the JSON every time.
+_TRACKER_CACHE = {"mtime": None, "data": None}
+
 
 def load_test_tracker() -> Dict:
     """Load the test tracker data from JSON file."""
-    if not os.path.exists(TEST_TRACKER_FILE):
+    try:
+        mtime = os.stat(TEST_TRACKER_FILE).st_mtime_ns
+    except OSError:
         return {
             "current_test_number": 1,
             "tests": [],
             "last_updated": datetime.now().strftime("%Y-%m-%d")
         }
-    
-    with open(TEST_TRACKER_FILE, 'r') as f:
-        return json.load(f)
+
+    if _TRACKER_CACHE["mtime"] == mtime:
+        return _TRACKER_CACHE["data"]
+
+    with open(TEST_TRACKER_FILE, 'rb') as f:
+        data = orjson.loads(f.read())
+
+    _TRACKER_CACHE["mtime"] = mtime
+    _TRACKER_CACHE["data"] = data
+    return data
 
 
 def save_test_tracker(data: Dict) -> None:
     """Save the test tracker data to JSON file."""
     data["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-    with open(TEST_TRACKER_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+
+    # Write to a temp file and replace, so a crash mid-write can't corrupt
+    # the tracker, then refresh the cache without re-reading.
+    tmp_file = TEST_TRACKER_FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, TEST_TRACKER_FILE)
+
+    _TRACKER_CACHE["mtime"] = os.stat(TEST_TRACKER_FILE).st_mtime_ns
+    _TRACKER_CACHE["data"] = data
 
 
 def add_test(description: str, status: str = "pending", notes: str = "", folder: str = "") -> int:
     """Add a new test to the tracker."""
     data = load_test_tracker()
-    
-    # Ensure test number is always the next available number
-    if data["tests"]:
-        # Find the highest test number and add 1
-        max_test_number = max(test["test_number"] for test in data["tests"])
-        test_number = max_test_number + 1
-    else:
-        test_number = 1
-    
+
+    # current_test_number already tracks the next free number; only fall
+    # back to scanning the tests list if an old tracker file lacks it
+    test_number = data.get("current_test_number") or (
+        max((test["test_number"] for test in data["tests"]), default=0) + 1
+    )
+
     new_test = {
         "test_number": test_number,
         "description": description,
@@ -111,13 +131,9 @@ def list_tests() -> None:
 def get_next_test_number() -> int:
     """Get the next test number without creating a test."""
     data = load_test_tracker()
-    
-    # Ensure we return the correct next number based on existing tests
-    if data["tests"]:
-        max_test_number = max(test["test_number"] for test in data["tests"])
-        return max_test_number + 1
-    else:
-        return 1
+    return data.get("current_test_number") or (
+        max((test["test_number"] for test in data["tests"]), default=0) + 1
+    )
 
 
 if __name__ == "__main__":